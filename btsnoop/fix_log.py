@@ -11,26 +11,33 @@ def to_text(cmd: bytes):
     return "".join([chr(i) if i >= 32 and i <= 126 else "." for i in cmd])
 
 
+strip_colons = str.maketrans("", "", ":")
+
+# The input CSV is only ids, directions and hex, so skip UTF-8 decoding.
+# newline="" is what the csv module expects of the files it reads and writes.
+sys.stdin.reconfigure(encoding="ascii", newline="")
+sys.stdout.reconfigure(encoding="utf-8", newline="")
+
 reader = csv.DictReader(sys.stdin)
 
 output_header = [
     "id", "dir", "is_known", "group", "is_reply", "command", "message", "original"
 ]
 
-writer = csv.DictWriter(sys.stdout, fieldnames=output_header)
-writer.writeheader()
+new_btsnoop_row = ["NEW_BTSNOOP", *[""] * (len(output_header) - 1)]
+
+writer = csv.writer(sys.stdout, lineterminator="\n")
+writer.writerow(output_header)
 
 phone_to_radio = BitStream()
 radio_to_phone = BitStream()
 
 for snoop_frame in reader:
     if snoop_frame["id"] == "NEW_BTSNOOP":
-        writer.writerow({
-            "id": "NEW_BTSNOOP"
-        })
+        writer.writerow(new_btsnoop_row)
         continue
 
-    data = bytes.fromhex(snoop_frame["data"].replace(":", ""))
+    data = bytes.fromhex(snoop_frame["data"].translate(strip_colons))
 
     match snoop_frame["dir"]:
         case "phone->radio":
@@ -50,13 +57,13 @@ for snoop_frame in reader:
 
     for frame in frames:
         message = Message.from_bytes(frame.data)
-        writer.writerow({
-            "id": snoop_frame["id"],
-            "dir": snoop_frame["dir"],
-            "is_known": True,
-            "group": message.command_group.name,
-            "is_reply": message.is_reply,
-            "command": message.command.name,
-            "message": str(message.body),
-            "original": message.to_bytes()
-        })
+        writer.writerow((
+            snoop_frame["id"],
+            snoop_frame["dir"],
+            True,
+            message.command_group.name,
+            message.is_reply,
+            message.command.name,
+            str(message.body),
+            message.to_bytes(),
+        ))
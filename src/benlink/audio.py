@@ -26,6 +26,7 @@ This example uses pyaudio to record audio from the default audio input device an
 """
 
 from __future__ import annotations
+from dataclasses import dataclass
 import typing as t
 import asyncio
 from .link import AudioLink, RfcommAudioLink
@@ -34,7 +35,8 @@ from . import protocol as p
 
 class AudioConnection:
     _link: AudioLink
-    _handlers: list[t.Callable[[AudioMessage], None]]
+    _handlers: t.Dict[int, t.Callable[[AudioMessage], None]]
+    _next_handler_id: int
 
     def is_connected(self) -> bool:
         return self._link.is_connected()
@@ -44,7 +46,8 @@ class AudioConnection:
         link: AudioLink,
     ):
         self._link = link
-        self._handlers = []
+        self._handlers = {}
+        self._next_handler_id = 0
 
     @classmethod
     def new_rfcomm(cls, device_uuid: str, channel: int | t.Literal["auto"] = "auto") -> AudioConnection:
@@ -59,10 +62,13 @@ class AudioConnection:
         return self._add_message_handler(on_message)
 
     def _add_message_handler(self, handler: t.Callable[[AudioMessage], None]) -> t.Callable[[], None]:
+        handler_id = self._next_handler_id
+        self._next_handler_id += 1
+
         def remove_handler():
-            self._handlers.remove(handler)
+            self._handlers.pop(handler_id, None)
 
-        self._handlers.append(handler)
+        self._handlers[handler_id] = handler
 
         return remove_handler
 
@@ -70,26 +76,26 @@ class AudioConnection:
         await self._link.send(audio_message_to_protocol(msg))
 
     async def send_message_expect_reply(self, msg: AudioMessage, reply: t.Type[AudioMessageT]) -> AudioMessageT:
-        queue: asyncio.Queue[AudioMessageT] = asyncio.Queue()
+        future: asyncio.Future[AudioMessageT] = asyncio.get_running_loop().create_future()
 
         def on_rcv(msg: AudioMessage):
-            if isinstance(msg, reply):
-                queue.put_nowait(msg)
+            if isinstance(msg, reply) and not future.done():
+                future.set_result(msg)
 
         remove_handler = self._add_message_handler(on_rcv)
 
-        await self.send_message(msg)
-
-        out = await queue.get()
-
-        remove_handler()
-
-        return out
+        try:
+            await self.send_message(msg)
+            return await future
+        finally:
+            remove_handler()
 
     async def connect(self) -> None:
         def on_msg(msg: p.AudioMessage):
-            for handler in self._handlers:
-                handler(audio_message_from_protocol(msg))
+            audio_message = audio_message_from_protocol(msg)
+            # Copy, since handlers may remove themselves while being called
+            for handler in list(self._handlers.values()):
+                handler(audio_message)
         await self._link.connect(on_msg)
 
     async def disconnect(self) -> None:
@@ -125,7 +131,8 @@ class AudioConnection:
         await self.disconnect()
 
 
-class AudioData(t.NamedTuple):
+@dataclass(frozen=True, slots=True)
+class AudioData:
     sbc_data: bytes
 
 
@@ -137,7 +144,8 @@ class AudioAck:
     pass
 
 
-class AudioUnknown(t.NamedTuple):
+@dataclass(frozen=True, slots=True)
+class AudioUnknown:
     type: int
     data: bytes
 
@@ -149,25 +157,24 @@ AudioMessage = AudioEvent | AudioAck
 AudioMessageT = t.TypeVar("AudioMessageT", bound=AudioMessage)
 
 
+_FROM_PROTOCOL: t.Dict[t.Type[t.Any], t.Callable[[t.Any], AudioMessage]] = {
+    p.AudioData: lambda m: AudioData(m.sbc_data),
+    p.AudioEnd: lambda _: AudioEnd(),
+    p.AudioAck: lambda _: AudioAck(),
+    p.AudioUnknown: lambda m: AudioUnknown(m.type, m.data),
+}
+
+_TO_PROTOCOL: t.Dict[t.Type[t.Any], t.Callable[[t.Any], p.AudioMessage]] = {
+    AudioData: lambda m: p.AudioData(m.sbc_data),
+    AudioEnd: lambda _: p.AudioEnd(),
+    AudioAck: lambda _: p.AudioAck(),
+    AudioUnknown: lambda m: p.AudioUnknown(m.type, m.data),
+}
+
+
 def audio_message_from_protocol(proto: p.AudioMessage) -> AudioMessage:
-    match proto:
-        case p.AudioData(sbc_data=sbc_data):
-            return AudioData(sbc_data)
-        case p.AudioEnd():
-            return AudioEnd()
-        case p.AudioAck():
-            return AudioAck()
-        case p.AudioUnknown(type=type, data=data):
-            return AudioUnknown(type, data)
+    return _FROM_PROTOCOL[type(proto)](proto)
 
 
 def audio_message_to_protocol(msg: AudioMessage) -> p.AudioMessage:
-    match msg:
-        case AudioData(sbc_data=sbc_data):
-            return p.AudioData(sbc_data)
-        case AudioEnd():
-            return p.AudioEnd()
-        case AudioAck():
-            return p.AudioAck()
-        case AudioUnknown(type=type, data=data):
-            return p.AudioUnknown(type, data)
+    return _TO_PROTOCOL[type(msg)](msg)
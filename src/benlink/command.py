@@ -51,11 +51,13 @@ RADIO_INDICATE_UUID = "00001102-d102-11e1-9b23-00025b00a5a5"
 
 class CommandConnection:
     _link: CommandLink
-    _handlers: t.List[RadioMessageHandler] = []
+    _handlers: t.Dict[int, RadioMessageHandler] = {}
+    _next_handler_id: int
 
     def __init__(self, link: CommandLink):
         self._link = link
-        self._handlers = []
+        self._handlers = {}
+        self._next_handler_id = 0
 
     @classmethod
     def new_ble(cls, device_uuid: str) -> CommandConnection:
@@ -82,10 +84,14 @@ class CommandConnection:
         await self._link.send(command_message_to_protocol(command))
 
     async def send_message_expect_reply(self, command: CommandMessage, expect: t.Type[RadioMessageT]) -> RadioMessageT | MessageReplyError:
-        queue: asyncio.Queue[RadioMessageT |
-                             MessageReplyError] = asyncio.Queue()
+        future: asyncio.Future[RadioMessageT | MessageReplyError] = (
+            asyncio.get_running_loop().create_future()
+        )
 
         def reply_handler(reply: RadioMessage):
+            if future.done():
+                return
+
             if (
                 isinstance(reply, expect) or
                 (
@@ -93,17 +99,15 @@ class CommandConnection:
                     reply.message_type is expect
                 )
             ):
-                queue.put_nowait(reply)
+                future.set_result(reply)
 
         remove_handler = self._add_message_handler(reply_handler)
 
-        await self.send_message(command)
-
-        out = await queue.get()
-
-        remove_handler()
-
-        return out
+        try:
+            await self.send_message(command)
+            return await future
+        finally:
+            remove_handler()
 
     def add_event_handler(self, handler: EventHandler) -> t.Callable[[], None]:
         def event_handler(msg: RadioMessage):
@@ -112,16 +116,20 @@ class CommandConnection:
         return self._add_message_handler(event_handler)
 
     def _add_message_handler(self, handler: RadioMessageHandler) -> t.Callable[[], None]:
-        self._handlers.append(handler)
+        handler_id = self._next_handler_id
+        self._next_handler_id += 1
+
+        self._handlers[handler_id] = handler
 
         def remove_handler():
-            self._handlers.remove(handler)
+            self._handlers.pop(handler_id, None)
 
         return remove_handler
 
     def _on_recv(self, msg: p.Message) -> None:
         radio_message = radio_message_from_protocol(msg)
-        for handler in self._handlers:
+        # Copy, since handlers may remove themselves while being called
+        for handler in list(self._handlers.values()):
             handler(radio_message)
 
     # Command API
@@ -149,6 +149,7 @@ from __future__ import annotations
 from typing_extensions import Unpack
 from dataclasses import dataclass
 import typing as t
+import asyncio
 import sys
 
 from .command import (
@@ -303,20 +304,24 @@ class RadioController:
         return self._conn.add_event_handler(handler)
 
     async def _hydrate(self) -> None:
-        device_info = await self._conn.get_device_info()
+        # These requests are pipelined: the links write them one at a time,
+        # but their replies are awaited together. Each expects a different
+        # reply type, so the replies can't be mixed up.
+        device_info, settings, beacon_settings, status = await asyncio.gather(
+            self._conn.get_device_info(),
+            self._conn.get_settings(),
+            self._conn.get_beacon_settings(),
+            self._conn.get_status(),
+        )
 
+        # Channel replies are only matched by type, not by channel id, so
+        # these have to be requested one at a time
         channels: t.List[Channel] = []
 
         for i in range(device_info.channel_count):
             channel_settings = await self._conn.get_channel(i)
             channels.append(channel_settings)
 
-        settings = await self._conn.get_settings()
-
-        beacon_settings = await self._conn.get_beacon_settings()
-
-        status = await self._conn.get_status()
-
         # No need to save the remove event handler function, since we don't
         # need to unregister it when we disconnect (the connection will take care of that)
         self._conn.add_event_handler(
@@ -40,18 +40,23 @@ RADIO_INDICATE_UUID = "00001102-d102-11e1-9b23-00025b00a5a5"
 
 class BleCommandLink:
     _client: BleakClient
+    _write_lock: asyncio.Lock
 
     def is_connected(self) -> bool:
         return self._client.is_connected
 
     def __init__(self, device_uuid: str):
         self._client = BleakClient(device_uuid)
+        self._write_lock = asyncio.Lock()
 
     async def send(self, msg: p.Message):
         await self.send_bytes(msg.to_bytes())
 
     async def send_bytes(self, data: bytes):
-        await self._client.write_gatt_char(RADIO_WRITE_UUID, data, response=True)
+        # Backends only allow one pending write per characteristic, so
+        # concurrent sends are written one at a time
+        async with self._write_lock:
+            await self._client.write_gatt_char(RADIO_WRITE_UUID, data, response=True)
 
     async def connect(self, callback: t.Callable[[p.Message], None]):
         await self._client.connect()
@@ -138,7 +143,8 @@ class AudioLink(t.Protocol):
 
 class RfcommAudioLink:
     _client: RfcommClient
-    _buffer: bytes
+    _buffer: bytearray
+    _read_pos: int
 
     def is_connected(self) -> bool:
         return self._client.is_connected()
@@ -154,7 +160,8 @@ class RfcommAudioLink:
                 "Auto channel selection not implemented yet"
             )
         self._client = RfcommClient(device_uuid, channel, read_size)
-        self._buffer = bytes()
+        self._buffer = bytearray()
+        self._read_pos = 0
 
     async def send(self, msg: p.AudioMessage) -> None:
         await self.send_bytes(p.audio_message_to_bytes(msg))
@@ -164,19 +171,24 @@ class RfcommAudioLink:
 
     async def connect(self, callback: t.Callable[[p.AudioMessage], None]):
         def on_data(data: bytes):
-            self._buffer = self._buffer + data
+            self._buffer.extend(data)
 
-            if len(self._buffer) == 0:
-                return
-
-            while len(self._buffer):
-                message, self._buffer = p.next_audio_message(self._buffer)
+            while self._read_pos < len(self._buffer):
+                message, self._read_pos = p.next_audio_message(
+                    self._buffer, self._read_pos
+                )
 
                 if message is None:
                     break
 
                 callback(message)
 
+            # Only drop consumed bytes once they make up most of the buffer,
+            # so the unread tail isn't copied on every read
+            if self._read_pos > 4096 and self._read_pos * 2 > len(self._buffer):
+                del self._buffer[:self._read_pos]
+                self._read_pos = 0
+
         await self._client.connect(on_data)
 
     async def disconnect(self):
@@ -196,6 +208,7 @@ class RfcommClient:
     _channel: int
     _read_size: int
     _st: SocketTask | None
+    _write_lock: asyncio.Lock
 
     @property
     def device_uuid(self) -> str:
@@ -214,7 +227,10 @@ class RfcommClient:
 
         loop = asyncio.get_event_loop()
 
-        await loop.sock_sendall(self._st.socket_handle, data)
+        # Overlapping sock_sendall calls on one socket can interleave or
+        # drop partial writes, so concurrent writes are serialized
+        async with self._write_lock:
+            await loop.sock_sendall(self._st.socket_handle, data)
 
     def __init__(
         self,
@@ -226,6 +242,7 @@ class RfcommClient:
         self._channel = channel
         self._read_size = read_size
         self._st = None
+        self._write_lock = asyncio.Lock()
 
     async def connect(
         self,
@@ -1,7 +1,12 @@
 from __future__ import annotations
+from dataclasses import dataclass
 import typing as t
 import sys
 
+# Internal debugging switch, not part of the public API. When True, discarded
+# (unframed) audio data is reported on stderr.
+_DEBUG = False
+
 
 def unescape_bytes(b: bytes) -> bytes:
     out = bytearray()
@@ -17,38 +22,33 @@ def unescape_bytes(b: bytes) -> bytes:
 
 
 def escape_bytes(b: bytes) -> bytes:
-    out = bytearray()
-    for byte in b:
-        if byte in (0x7d, 0x7e):
-            out.append(0x7d)
-            out.append(byte ^ 0x20)
-        else:
-            out.append(byte)
-    return bytes(out)
+    # 0x7d must be escaped first, so the escapes added for 0x7e aren't escaped again
+    return b.replace(b'\x7d', b'\x7d\x5d').replace(b'\x7e', b'\x7d\x5e')
 
 
-def framed_read_bytes(b: bytes, framing_char: bytes) -> t.Tuple[bytes | None, bytes]:
-    start = b.find(framing_char)
+def framed_read_bytes(b: bytes | bytearray, framing_char: bytes, start: int) -> t.Tuple[bytes | None, int]:
+    frame_start = b.find(framing_char, start)
 
-    if start == -1:
-        return None, b
+    if frame_start == -1:
+        # No frame can begin in the rest of the buffer, so skip all of it
+        frame_start = len(b)
 
-    end = b.find(framing_char, start + 1)
+    if frame_start != start and _DEBUG:
+        print("Warning: Discarding garbage audio data", file=sys.stderr)
 
-    if end == -1:
-        return None, b
+    end = b.find(framing_char, frame_start + 1)
 
-    if start != 0:
-        print("Warning: Discarding garbage audio data", file=sys.stderr)
+    if end == -1:
+        return None, frame_start
 
-    return b[start:end+1], b[end+1:]
+    return bytes(memoryview(b)[frame_start:end+1]), end+1
 
 
-def next_audio_message(b: bytes) -> t.Tuple[AudioMessage | None, bytes]:
-    frame, rest = framed_read_bytes(b, b'\x7e')
+def next_audio_message(b: bytes | bytearray, start: int) -> t.Tuple[AudioMessage | None, int]:
+    frame, end = framed_read_bytes(b, b'\x7e', start)
     if frame is None:
-        return None, rest
-    return audio_message_from_bytes(frame), rest
+        return None, end
+    return audio_message_from_bytes(frame), end
 
 
 def audio_message_from_bytes(frame: bytes) -> AudioMessage:
@@ -69,21 +69,27 @@ def audio_message_from_bytes(frame: bytes) -> AudioMessage:
             return AudioUnknown(type=unescaped_frame[0], data=unescaped_frame[1:])
 
 
+# None of these bytes need escaping, so the frames can be written out as-is
+_AUDIO_DATA_PREFIX = b'\x7e\x00'
+_AUDIO_END_FRAME = b'\x7e\x01' + b'\x00' * 8 + b'\x7e'
+_AUDIO_ACK_FRAME = b'\x7e\x02' + b'\x00' * 8 + b'\x7e'
+
+
 def audio_message_to_bytes(msg: AudioMessage) -> bytes:
     match msg:
         case AudioData(sbc_data=sbc_data):
-            unescaped_frame = b'\x00' + sbc_data
+            return b''.join((_AUDIO_DATA_PREFIX, escape_bytes(sbc_data), b'\x7e'))
         case AudioEnd():
-            unescaped_frame = b'\x01' + b'\x00' * 8
+            return _AUDIO_END_FRAME
         case AudioAck():
-            unescaped_frame = b'\x02' + b'\x00' * 8
+            return _AUDIO_ACK_FRAME
         case AudioUnknown(type=type, data=data):
             unescaped_frame = bytes([type]) + data
-
-    return b'\x7e' + escape_bytes(unescaped_frame) + b'\x7e'
+            return b''.join((b'\x7e', escape_bytes(unescaped_frame), b'\x7e'))
 
 
-class AudioData(t.NamedTuple):
+@dataclass(frozen=True, slots=True)
+class AudioData:
     sbc_data: bytes
 
 
@@ -95,7 +101,8 @@ class AudioAck:
     pass
 
 
-class AudioUnknown(t.NamedTuple):
+@dataclass(frozen=True, slots=True)
+class AudioUnknown:
     type: int
     data: bytes
 
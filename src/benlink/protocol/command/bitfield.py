@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing_extensions import dataclass_transform, TypeVar as TypeVarDefault, Self
 import typing as t
 import inspect
+import itertools
 
 from enum import IntEnum, IntFlag, Enum
 
@@ -26,6 +27,16 @@ def reorder_pairs(order: t.Sequence[int], size: int):
     )
 
 
+# Bit expansion of every possible byte value (MSB first), so decoding a byte
+# string is a table lookup per byte rather than eight Python-level bit ops
+_BYTE_BITS: t.Tuple[t.Tuple[bool, ...], ...] = tuple(
+    tuple(byte & (1 << (7 - i)) != 0 for i in range(8)) for byte in range(256)
+)
+
+# Maps a bit stored as a byte (0 or 1) to its ASCII digit, for parsing with int(x, 2)
+_BIT_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
 class Bits(t.Tuple[bool, ...]):
     def __new__(cls, bits: t.Iterable[bool] | str = ()) -> Bits:
         if isinstance(bits, str):
@@ -46,11 +57,12 @@ class Bits(t.Tuple[bool, ...]):
         return super().__getitem__(index)
 
     def __add__(self, other: t.Tuple[object, ...]) -> Bits:
+        if isinstance(other, Bits):
+            return Bits(super().__add__(other))
         return Bits(super().__add__(tuple(bool(bit) for bit in other)))
 
     def __repr__(self) -> str:
-        str_bits = "".join(str(int(bit)) for bit in self)
-        return f"{self.__class__.__name__}({str_bits!r})"
+        return f"{self.__class__.__name__}({self.to_bit_str()!r})"
 
     def reorder(self, order: t.Sequence[int]):
         if not order:
@@ -74,10 +86,7 @@ class Bits(t.Tuple[bool, ...]):
 
     @classmethod
     def from_bytes(cls, data: t.ByteString) -> Bits:
-        bits: t.List[bool] = []
-        for byte in data:
-            bits += cls.from_int(byte, 8)
-        return cls(bits)
+        return cls(itertools.chain.from_iterable(map(_BYTE_BITS.__getitem__, data)))
 
     @classmethod
     def from_int(cls, value: int, n_bits: int) -> Bits:
@@ -85,24 +94,34 @@ class Bits(t.Tuple[bool, ...]):
             raise ValueError("Number of bits must be positive")
         if value >= 1 << n_bits:
             raise ValueError(f"Value {value} is too large for {n_bits} bits")
-        return cls(
-            value & (1 << (n_bits - i - 1)) != 0 for i in range(n_bits)
-        )
+        if n_bits == 1:
+            # Fast path for single-bit fields (e.g. every bf_bool)
+            return cls((value & 1 == 1,))
+        # Masking keeps the two's complement bits of negative values
+        digits = format(value & ((1 << n_bits) - 1), f"0{n_bits}b")
+        return cls(map("1".__eq__, digits))
 
     def to_int(self) -> int:
-        out = 0
-        for i, bit in enumerate(self):
-            out |= bit << (len(self) - i - 1)
-        return out
+        if not self:
+            return 0
+        if len(self) == 1:
+            # Fast path for single-bit fields (e.g. every bf_bool)
+            return 1 if tuple.__getitem__(self, 0) else 0
+        return int(bytes(self).translate(_BIT_DIGITS), 2)
 
     def to_bytes(self) -> bytes:
         if len(self) % 8:
             raise ValueError("Bits is not byte aligned (multiple of 8 bits)")
-        return bytes(self[i:i+8].to_int() for i in range(0, len(self), 8))
+        return self.to_int().to_bytes(len(self) // 8, "big")
 
     def to_str(self, encoding: str = "utf-8") -> str:
         return self.to_bytes().decode(encoding)
 
+    def to_bit_str(self) -> str:
+        if not self:
+            return ""
+        return format(self.to_int(), f"0{len(self)}b")
+
 
 class BitStream:
     _bits: Bits
@@ -135,7 +154,7 @@ class BitStream:
         return self.peek(n*8).to_bytes()
 
     def __repr__(self) -> str:
-        str_bits = "".join(str(int(bit)) for bit in self._bits[self._pos:])
+        str_bits = self._bits[self._pos:].to_bit_str()
         return f"{self.__class__.__name__}({str_bits})"
 
     def extend(self, other: Bits):
@@ -525,14 +544,20 @@ def bf_bytes(n: int, *, default: bytes | NotProvided = NOT_PROVIDED) -> BFTypeDi
             f"expected default bytes of length {n} bytes, got {len(default)} bytes ({default!r})"
         )
 
-    class ListAsBytes:
-        def forward(self, x: t.List[int]) -> bytes:
-            return bytes(x)
+    # A negative length (e.g. from a dynamic field with no bits left) reads
+    # nothing, so the next field hits EOF instead of re-reading earlier bits
+    n_bytes = max(n, 0)
+
+    class BitsAsBytes:
+        def forward(self, x: Bits) -> bytes:
+            return x.to_bytes()
 
-        def back(self, y: bytes) -> t.List[int]:
-            return list(y)
+        def back(self, y: bytes) -> Bits:
+            if len(y) != n_bytes:
+                raise ValueError(f"expected {n_bytes} bytes, got {len(y)}")
+            return Bits.from_bytes(y)
 
-    return bf_map(bf_list(bf_int(8), n), ListAsBytes(), default=default)
+    return bf_map(bf_bits(n_bytes * 8), BitsAsBytes(), default=default)
 
 
 def bf_str(n: int, encoding: str = "utf-8", *, default: str | NotProvided = NOT_PROVIDED) -> BFTypeDisguised[str]:
@@ -132,61 +132,59 @@ class BasicCommand(IntEnum):
     GET_PF_ACTIONS = 75
 
 
+# Built once, rather than constructing a new enum field for every message
+_COMMAND_FIELDS = {
+    CommandGroup.BASIC: bf_int_enum(BasicCommand, 15),
+    CommandGroup.EXTENDED: bf_int_enum(ExtendedCommand, 15),
+}
+
+
 def frame_type_disc(m: Message):
-    match m.command_group:
-        case CommandGroup.BASIC:
-            return bf_int_enum(BasicCommand, 15)
-        case CommandGroup.EXTENDED:
-            return bf_int_enum(ExtendedCommand, 15)
+    return _COMMAND_FIELDS[m.command_group]
+
+
+# (command body, reply body) for each basic command with a known body layout.
+# Commands that can't be replies have a reply body of None.
+_BASIC_COMMAND_BODIES: t.Dict[BasicCommand, t.Tuple[t.Type[Bitfield], t.Type[Bitfield] | None]] = {
+    BasicCommand.GET_DEV_INFO: (GetDevInfoBody, GetDevInfoReplyBody),
+    BasicCommand.READ_STATUS: (ReadPowerStatusBody, ReadPowerStatusReplyBody),
+    BasicCommand.READ_RF_CH: (ReadRFChBody, ReadRFChReplyBody),
+    BasicCommand.WRITE_RF_CH: (WriteRFChBody, WriteRFChReplyBody),
+    BasicCommand.READ_SETTINGS: (ReadSettingsBody, ReadSettingsReplyBody),
+    BasicCommand.WRITE_SETTINGS: (WriteSettingsBody, WriteSettingsReplyBody),
+    BasicCommand.GET_PF: (GetPFBody, GetPFReplyBody),
+    BasicCommand.READ_BSS_SETTINGS: (ReadBSSSettingsBody, ReadBSSSettingsReplyBody),
+    BasicCommand.WRITE_BSS_SETTINGS: (WriteBSSSettingsBody, WriteBSSSettingsReplyBody),
+    BasicCommand.EVENT_NOTIFICATION: (EventNotificationBody, None),
+    BasicCommand.REGISTER_NOTIFICATION: (RegisterNotificationBody, None),
+    BasicCommand.HT_SEND_DATA: (HTSendDataBody, HTSendDataReplyBody),
+    BasicCommand.SET_PHONE_STATUS: (SetPhoneStatusBody, SetPhoneStatusReplyBody),
+    BasicCommand.GET_HT_STATUS: (GetHtStatusBody, GetHtStatusReplyBody),
+}
 
 
 def body_disc(m: Message, n: int):
     assert n % 8 == 0
-    match m.command_group:
-        case CommandGroup.BASIC:
-            match m.command:
-                case BasicCommand.GET_DEV_INFO:
-                    out = GetDevInfoReplyBody if m.is_reply else GetDevInfoBody
-                case BasicCommand.READ_STATUS:
-                    out = ReadPowerStatusReplyBody if m.is_reply else ReadPowerStatusBody
-                case BasicCommand.READ_RF_CH:
-                    out = ReadRFChReplyBody if m.is_reply else ReadRFChBody
-                case BasicCommand.WRITE_RF_CH:
-                    out = WriteRFChReplyBody if m.is_reply else WriteRFChBody
-                case BasicCommand.READ_SETTINGS:
-                    out = ReadSettingsReplyBody if m.is_reply else ReadSettingsBody
-                case BasicCommand.WRITE_SETTINGS:
-                    out = WriteSettingsReplyBody if m.is_reply else WriteSettingsBody
-                case BasicCommand.GET_PF:
-                    out = GetPFReplyBody if m.is_reply else GetPFBody
-                case BasicCommand.READ_BSS_SETTINGS:
-                    out = ReadBSSSettingsReplyBody if m.is_reply else ReadBSSSettingsBody
-                case BasicCommand.WRITE_BSS_SETTINGS:
-                    out = WriteBSSSettingsReplyBody if m.is_reply else WriteBSSSettingsBody
-                case BasicCommand.EVENT_NOTIFICATION:
-                    if m.is_reply:
-                        raise ValueError("EventNotification cannot be a reply")
-                    out = EventNotificationBody
-                case BasicCommand.REGISTER_NOTIFICATION:
-                    if m.is_reply:
-                        raise ValueError(
-                            "RegisterNotification cannot be a reply"
-                        )
-                    out = RegisterNotificationBody
-                case BasicCommand.HT_SEND_DATA:
-                    out = HTSendDataReplyBody if m.is_reply else HTSendDataBody
-                case BasicCommand.SET_PHONE_STATUS:
-                    out = SetPhoneStatusReplyBody if m.is_reply else SetPhoneStatusBody
-                case BasicCommand.GET_HT_STATUS:
-                    out = GetHtStatusReplyBody if m.is_reply else GetHtStatusBody
-                case _:
-                    return bf_bytes(n // 8)
-        case CommandGroup.EXTENDED:
-            match m.command:
-                case _:
-                    return bf_bytes(n // 8)
-
-    return bf_bitfield(out, n)
+
+    if m.command_group != CommandGroup.BASIC:
+        return bf_bytes(n // 8)
+
+    bodies = _BASIC_COMMAND_BODIES.get(t.cast(BasicCommand, m.command))
+
+    if bodies is None:
+        return bf_bytes(n // 8)
+
+    body, reply_body = bodies
+
+    if not m.is_reply:
+        return bf_bitfield(body, n)
+
+    if reply_body is None:
+        raise ValueError(
+            f"{body.__name__.removesuffix('Body')} cannot be a reply"
+        )
+
+    return bf_bitfield(reply_body, n)
 
 
 MessageBody = t.Union[
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+import typing as t
+
+from benlink import protocol as p
+from benlink.protocol import audio
+from benlink.link import RfcommAudioLink
+
+
+class FakeRfcommClient:
+    callback: t.Callable[[bytes], None]
+
+    async def connect(self, callback: t.Callable[[bytes], None]):
+        self.callback = callback
+
+
+def test_rfcomm_audio_link_stream():
+    link = RfcommAudioLink("00:00:00:00:00:00", channel=1)
+    client = FakeRfcommClient()
+    link._client = client  # type: ignore
+
+    received: t.List[p.AudioMessage] = []
+    asyncio.run(link.connect(received.append))
+
+    sent = [p.AudioData(bytes([i, 0x7d, 0x7e]) * 30) for i in range(100)]
+    stream = b''.join(p.audio_message_to_bytes(m) for m in sent)
+
+    # More than the 4096 byte compaction threshold, fed in pieces that split
+    # frames at arbitrary points
+    assert len(stream) > 2 * 4096
+    for i in range(0, len(stream), 37):
+        client.callback(stream[i:i+37])
+
+    assert received == sent
+    assert len(link._buffer) < len(stream)
+    assert link._read_pos == len(link._buffer)
+
+
+def test_framed_read_garbage_no_frame_start():
+    assert p.framed_read_bytes(b'ab', b'\x7e', 0) == (None, 2)
+    assert p.framed_read_bytes(b'xxab', b'\x7e', 2) == (None, 4)
+
+
+def test_framed_read_garbage_partial_frame():
+    assert p.framed_read_bytes(b'ab\x7e\x00c', b'\x7e', 0) == (None, 2)
+    # Once skipped, the partial frame stays put until the rest arrives
+    assert p.framed_read_bytes(b'ab\x7e\x00c', b'\x7e', 2) == (None, 2)
+
+
+def test_framed_read_garbage_complete_frame():
+    buf = b'ab\x7e\x00c\x7e\x7e\x01'
+    assert p.framed_read_bytes(buf, b'\x7e', 0) == (b'\x7e\x00c\x7e', 6)
+    assert p.framed_read_bytes(buf, b'\x7e', 6) == (None, 6)
+
+
+def test_framed_read_debug_warning(capsys: t.Any, monkeypatch: t.Any):
+    p.framed_read_bytes(b'ab\x7e\x00c\x7e', b'\x7e', 0)
+    assert capsys.readouterr().err == ""
+
+    monkeypatch.setattr(audio, "_DEBUG", True)
+    p.framed_read_bytes(b'ab\x7e\x00c\x7e', b'\x7e', 0)
+    assert "Discarding garbage audio data" in capsys.readouterr().err
@@ -241,3 +241,51 @@ def test_bit_reorder():
 
     assert b.reorder(order) == Bits("010110")
     assert b.reorder(order).unreorder(order) == b
+
+
+def test_bits_from_bytes():
+    assert Bits.from_bytes(b'') == Bits()
+    assert Bits.from_bytes(b'\x80\x01') == Bits("1000000000000001")
+    assert Bits.from_bytes(bytes(range(256))).to_bytes() == bytes(range(256))
+
+
+def test_bits_to_int():
+    assert Bits().to_int() == 0
+    assert Bits("0").to_int() == 0
+    assert Bits("1").to_int() == 1
+    assert Bits("0101").to_int() == 5
+    assert Bits.from_int(0x3ff, 10).to_int() == 0x3ff
+
+
+def test_bits_repr():
+    assert repr(Bits()) == "Bits('')"
+    assert repr(Bits("00101")) == "Bits('00101')"
+
+
+def test_bytes_field_length():
+    class Work(Bitfield):
+        a: bytes = bf_bytes(3)
+
+    assert Work.from_bytes(b'abc') == Work(a=b'abc')
+
+    with pytest.raises(ValueError, match=re.escape("error in field 'a' of 'Work': expected 3 bytes, got 2")):
+        Work(a=b'ab').to_bytes()
+
+
+def test_bytes_field_negative_length():
+    class Work(Bitfield):
+        a: int = bf_int(8)
+        b: bytes = bf_dyn(lambda _, n: bf_bytes((n - 1) // 8))
+        c: int = bf_int(8)
+
+    assert Work.from_bytes(b'\x07\x01\x02') == Work(a=7, b=b'\x01', c=2)
+
+    with pytest.raises(EOFError):
+        Work.from_bytes(b'\x07')
+
+
+def test_bits_from_int():
+    assert Bits.from_int(0, 1) == Bits("0")
+    assert Bits.from_int(1, 1) == Bits("1")
+    assert Bits.from_int(5, 4) == Bits("0101")
+    assert Bits.from_int(-1, 4) == Bits("1111")
@@ -7,7 +7,9 @@ init_path = Path('src/benlink/__init__.py')
 
 readme_content = readme_path.read_text().splitlines()
 
-init_content = init_path.read_text().splitlines()
+init_text = init_path.read_text()
+
+init_content = init_text.splitlines()
 
 docstring_start = init_content.index('"""')
 
@@ -25,7 +27,7 @@ if readme_start == -1:
     raise ValueError("No content section found in README.md.")
 
 readme_content_stripped = [
-    line[1:] if line.startswith("##") else line
+    line[1:] if line[:2] == "##" else line
     for line in readme_content[readme_start+1:]
 ]
 
@@ -36,6 +38,10 @@ updated_content = [
     *init_content[docstring_end:]
 ]
 
-init_path.write_text("\n".join(updated_content))
+updated_text = "\n".join(updated_content)
 
-print(f"README content has been updated into module definition")
+if updated_text == init_text:
+    print("Module definition is already up to date with README content")
+else:
+    init_path.write_text(updated_text)
+    print(f"README content has been updated into module definition")